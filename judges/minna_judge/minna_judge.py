@@ -6,6 +6,9 @@ import logging
 
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
 import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import json
 import dataclasses
 import os
@@ -31,8 +34,45 @@ from autojudge_base.nugget_data import (
 from minima_llm import MinimaLlmConfig, MinimaLlmRequest, OpenAIMinimaLlm
 from transformers import AutoModelForSequenceClassification, T5Tokenizer
 from sentence_transformers import CrossEncoder
+import numpy as np
 import torch
 
+# orjson (SIMD-accelerated) decodes large claim/nugget arrays far faster than
+# the stdlib; optional, falls back to json transparently.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(text: str):
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+        # existing except clauses keep working.
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# jiter (the Rust parser behind the OpenAI SDK) is optional too; its partial
+# mode can salvage a claim array the LLM truncated at its output limit,
+# where a strict parser would throw everything away.
+try:
+    import jiter
+except ImportError:
+    jiter = None
+
+
+def parse_claims(text) -> list:
+    if jiter is not None:
+        try:
+            return jiter.from_json(text.encode(), partial_mode=True)
+        except (ValueError, AttributeError):
+            return []
+    try:
+        return json_loads(text)
+    except (json.JSONDecodeError, AttributeError):
+        return []
+
 
 class _VectaraHHEM:
     """Wrapper around HHEMv2 with .predict() matching CrossEncoder interface."""
@@ -44,17 +84,46 @@ class _VectaraHHEM:
             "vectara/hallucination_evaluation_model", trust_remote_code=True
         ).to(self._device)
         self._model.eval()
+        if self._device == "cuda" and torch.cuda.is_bf16_supported():
+            # bf16 halves weight/activation traffic on tensor-core GPUs.
+            # NOT fp16: T5-family models overflow to NaN in float16.
+            try:
+                self._model = self._model.to(torch.bfloat16)
+            except Exception as e:
+                print(f"_VectaraHHEM: bf16 conversion failed, staying fp32: {e}")
         print(f"_VectaraHHEM: using device={self._device}")
+        # token-id memo: the same doc text appears in many (doc, claim) pairs,
+        # and BPE tokenization is a noticeable slice of predict() time
+        self._token_cache: Dict[str, List[int]] = {}
+
+    def _encode(self, text: str) -> List[int]:
+        ids = self._token_cache.get(text)
+        if ids is None:
+            ids = self._tokenizer(
+                text, truncation=True, max_length=512, add_special_tokens=False
+            )["input_ids"]
+            self._token_cache[text] = ids
+        return ids
 
     def predict(self, sentence_pairs, batch_size: int = 256):
         scores = []
         for i in range(0, len(sentence_pairs), batch_size):
             batch = sentence_pairs[i:i + batch_size]
-            
-            inputs = self._tokenizer(
-                [p[0] for p in batch], [p[1] for p in batch],
-                return_tensors="pt", padding=True, truncation=True,
-                max_length=512,
+
+            # assemble premise/hypothesis pairs from cached ids; pad() builds
+            # the attention masks. The hypothesis (claim) gets its slots
+            # reserved first so a long doc can never truncate it away.
+            features = []
+            for premise, hypothesis in batch:
+                hyp_ids = self._encode(hypothesis)[:254]
+                prem_ids = self._encode(premise)[:512 - len(hyp_ids) - 2]
+                features.append({
+                    "input_ids": self._tokenizer.build_inputs_with_special_tokens(
+                        prem_ids, hyp_ids
+                    )
+                })
+            inputs = self._tokenizer.pad(
+                features, padding=True, return_tensors="pt"
             ).to(self._device)
             with torch.no_grad():
                 logits = self._model(**inputs).logits
@@ -62,11 +131,128 @@ class _VectaraHHEM:
         return scores
 
 
-nli_model = _VectaraHHEM()
+class _OnnxCrossEncoder:
+    """int8-quantized ONNX export of an NLI cross-encoder with a .predict()
+    matching the CrossEncoder interface (returns raw 3-class logits)."""
+
+    def __init__(self, model_name: str, save_dir: str):
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+
+        # export + quantize once; later runs load the cached artifact
+        if not os.path.exists(os.path.join(save_dir, "model_quantized.onnx")):
+            print(f"_OnnxCrossEncoder: exporting {model_name} to int8 ONNX at {save_dir}...")
+            model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+            quantizer = ORTQuantizer.from_pretrained(model)
+            quantizer.quantize(
+                save_dir=save_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False),
+            )
+        self._model = ORTModelForSequenceClassification.from_pretrained(
+            save_dir, file_name="model_quantized.onnx"
+        )
+        self._tokenizer = AutoTokenizer.from_pretrained(model_name)
+
+    def predict(self, sentence_pairs, batch_size: int = 64, **kwargs):
+        scores = []
+        for i in range(0, len(sentence_pairs), batch_size):
+            batch = sentence_pairs[i:i + batch_size]
+            inputs = self._tokenizer(
+                [p[0] for p in batch], [p[1] for p in batch],
+                return_tensors="pt", padding=True, truncation=True,
+                max_length=512,
+            )
+            logits = self._model(**inputs).logits
+            scores.extend(np.asarray(logits))
+        return scores
+
+
+# Models are loaded lazily and shared across calls — importing this module
+# (e.g. for the nugget/qrels phases) no longer pulls gigabytes of weights.
+
+@functools.lru_cache(maxsize=1)
+def _get_nli() -> _VectaraHHEM:
+    return _VectaraHHEM()
+
 
-# deberta NLI for citation accuracy (run4 approach: strict 3-class entailment)
-citation_nli_model = CrossEncoder("cross-encoder/nli-deberta-v3-base")
-print("citation_nli_model: loaded cross-encoder/nli-deberta-v3-base")
+@functools.lru_cache(maxsize=1)
+def _get_citation_nli():
+    # deberta NLI for citation accuracy (run4 approach: strict 3-class entailment)
+    if not torch.cuda.is_available():
+        # CPU: dynamic int8 via onnxruntime is ~2-4x fp32 eager on VNNI chips.
+        # Only argmax over the logits is consumed, so quantization noise in
+        # the magnitudes doesn't move the entailment decision much.
+        try:
+            model = _OnnxCrossEncoder("cross-encoder/nli-deberta-v3-base", "onnx-nli-int8")
+            print("citation_nli_model: loaded int8 ONNX cross-encoder/nli-deberta-v3-base")
+            return model
+        except ImportError:
+            pass  # optimum/onnxruntime not installed — eager fallback below
+        except Exception as e:
+            print(f"_get_citation_nli: int8 ONNX path failed, falling back to eager: {e}")
+    model = CrossEncoder(
+        "cross-encoder/nli-deberta-v3-base",
+        device="cuda" if torch.cuda.is_available() else "cpu",
+    )
+    if torch.cuda.is_available():
+        try:
+            model.model.half()
+        except Exception as e:
+            print(f"_get_citation_nli: fp16 conversion failed, staying fp32: {e}")
+    print("citation_nli_model: loaded cross-encoder/nli-deberta-v3-base")
+    return model
+
+
+# Prompt constants: the system strings are single shared objects and the
+# user-side templates are prebound str.format callables, so the request
+# loops do one C-level format call instead of rebuilding literals.
+SYS_NUGGET_QUESTIONS = (
+    "You are an evaluation expert. Given a question, break it into specific subquestions "
+    "that a complete answer must address. Each subquestion should be atomic (cover only 1 aspect), "
+    "independently assessable (don't need further subquestions to answer it), "
+    "and cover a distinct aspect of the question. "
+    "Return ONLY a JSON array of strings. "
+    'Example: ["What year was the US founded?", "How many children did Britney Spears have?"]'
+)
+
+SYS_QRELS_GRADE = (
+    "How well does this response answer each of the numbered questions? "
+    "For every question reply with a single number from 0 to 5:\n"
+    "  5 = fully answers with specific evidence and details\n"
+    "  4 = fully answers in general terms\n"
+    "  3 = partially answers most of the question\n"
+    "  2 = partially answers some of the question\n"
+    "  1 = barely addresses the question\n"
+    "  0 = does not address the question\n"
+    "Return ONLY a JSON array of integers, one per question, in order. "
+    "Example: [5, 0, 3]"
+)
+
+SYS_RETRIEVAL = (
+    "Do these retrieved documents contain information "
+    "that answers each of the numbered questions? "
+    "For every question reply with a single number:\n"
+    "  2 = documents fully answer the question\n"
+    "  1 = documents partially answer the question\n"
+    "  0 = documents do not answer the question\n"
+    "Return ONLY a JSON array of integers, one per question, in order. "
+    "Example: [2, 0, 1]"
+)
+
+SYS_CLAIMS = (
+    "You are a claim extractor. Break this response into specific claims that "
+    "could be verified against a source document. Each claim should be a single, "
+    "self-contained statement. Include all types: facts, opinions, predictions, "
+    "and hedged statements. For hedged claims, preserve the hedging language. "
+    "Return ONLY a JSON array of strings. "
+    "Example: [\"The war started in 1914.\", "
+    "\"Everybody in the family agreed that it was a bad meal.\"] "
+)
+
+_QRELS_USER = "Questions:\n{}\n\nResponse: {}".format
+_RETRIEVAL_USER = "Questions:\n{}\n\nRetrieved documents:\n{}".format
+_CLAIMS_USER = "Response: {}".format
 
 
 # FINAL = 0.5*(max(cite, attr) + ret)
@@ -89,6 +275,8 @@ class GradeRecord:
 
 MINIMAL_QRELS_SPEC = QrelsSpec[GradeRecord](
     topic_id=lambda r: r.topic_id,
+    # doc ids must stay in autojudge_base's md5 namespace — eval consumers
+    # hash response texts on their side, so a faster hash here would desync
     doc_id=lambda r: doc_id_md5(r.text),
     grade=lambda r: r.grade,
     on_duplicate="keep_max",
@@ -115,9 +303,7 @@ class MinnaNuggetCreator:
 
         limit = kwargs.get("max_nuggets", questions_per_topic)
 
-        full_config = MinimaLlmConfig.from_dict(llm_config.raw) if llm_config.raw else MinimaLlmConfig.from_env()
-        full_config = dataclasses.replace(full_config, rpm=300, max_attempts=100, max_outstanding=8)
-        backend = OpenAIMinimaLlm(full_config)
+        backend = get_backend(llm_config)
 
         # fix2-6: collect diverse response samples to inform nugget generation -- not very effective
         responses = list(rag_responses)
@@ -152,20 +338,13 @@ class MinnaNuggetCreator:
             requests.append(MinimaLlmRequest(
                 request_id=topic.request_id,
                 messages=[
-                    {"role": "system", "content": (
-                        "You are an evaluation expert. Given a question, break it into specific subquestions "
-                        "that a complete answer must address. Each subquestion should be atomic (cover only 1 aspect), "
-                        "independently assessable (don't need further subquestions to answer it), "
-                        "and cover a distinct aspect of the question. "
-                        "Return ONLY a JSON array of strings. "
-                        'Example: ["What year was the US founded?", "How many children did Britney Spears have?"]'
-                    )},
+                    {"role": "system", "content": SYS_NUGGET_QUESTIONS},
                     {"role": "user", "content": context},
                 ],
                 temperature=0.3,
             ))
 
-        results = asyncio.run(backend.run_batched(requests))
+        results = run_async(backend.run_batched(requests))
 
         for topic, result in zip(rag_topics, results):
             bank = NuggetBank(
@@ -173,7 +352,7 @@ class MinnaNuggetCreator:
                 title_query=topic.title or topic.request_id,
             )
             try:
-                parsed = json.loads(result.text)
+                parsed = json_loads(result.text)
                 if not isinstance(parsed, list):
                     print(f"WARNING: LLM returned non-list for topic {topic.request_id}: {type(parsed)}")
                     parsed = []
@@ -221,64 +400,68 @@ class MinnaQrelsCreator:
     ) -> Optional[Qrels]:
 
         os.makedirs(self.CACHE_DIR, exist_ok=True)
-        full_config = MinimaLlmConfig.from_dict(llm_config.raw) if llm_config.raw else MinimaLlmConfig.from_env()
-        full_config = dataclasses.replace(full_config, rpm=300, max_attempts=100, max_outstanding=8)
-        backend = OpenAIMinimaLlm(full_config)
+        backend = get_backend(llm_config)
 
         cache = load_cache(self.CACHE_PATH)
 
         responses = list(rag_responses)
+        # hoist: nuggets_as_list() builds a fresh list per call — once per
+        # topic is enough, not once per response
+        topic_nuggets = (
+            {tid: bank.nuggets_as_list() for tid, bank in nugget_banks.banks.items()}
+            if nugget_banks else {}
+        )
+        # fetch each response's text once — get_report_text() rebuilds the
+        # report string on every call and both passes below need it
+        texts = {
+            (r.metadata.run_id, r.metadata.topic_id): r.get_report_text()
+            for r in responses
+        }
         grade_records: List[GradeRecord] = []
-        requests_info: List[Tuple[str, str, str, MinimaLlmRequest]] = []
+        requests_info: List[Tuple[str, str, List[str], MinimaLlmRequest]] = []
 
-        # Build LLM requests only for cache misses.
+        # fix2-7: one fused request per (response, topic) grading ALL nuggets
+        # at once instead of one round-trip per nugget — same cache layout, so
+        # per-nugget grades from earlier runs still hit.
         for response in responses:
             topic_id = response.metadata.topic_id
             run_id = response.metadata.run_id
-            text = response.get_report_text()
+            text = texts[(run_id, topic_id)]
 
             if topic_id not in nugget_banks.banks:
                 continue
 
-            nuggets = nugget_banks.banks[topic_id].nuggets_as_list()
+            nuggets = topic_nuggets[topic_id]
 
-            for nugget in nuggets:
-                cache_key = f"{run_id}_{topic_id}_{nugget.question_id}"
-                if cache_key in cache:
-                    continue
-                requests_info.append((
-                    run_id, topic_id, nugget.question_id,
-                    MinimaLlmRequest(
-                        request_id=cache_key,
-                        messages=[
-                            {"role": "system", "content": (
-                                "How well does this response answer this question? "
-                                "Reply with a single number from 0 to 5:\n"
-                                "  5 = fully answers with specific evidence and details\n"
-                                "  4 = fully answers in general terms\n"
-                                "  3 = partially answers most of the question\n"
-                                "  2 = partially answers some of the question\n"
-                                "  1 = barely addresses the question\n"
-                                "  0 = does not address the question"
-                            )},
-                            {"role": "user", "content": f"Question: {nugget.question}\n\nResponse: {text}"},
-                        ],
-                        temperature=0.0,
-                    )
-                ))
+            if all(f"{run_id}_{topic_id}_{n.question_id}" in cache for n in nuggets):
+                continue
+
+            numbered = "\n".join(f"{i + 1}. {n.question}" for i, n in enumerate(nuggets))
+            requests_info.append((
+                run_id, topic_id, [n.question_id for n in nuggets],
+                MinimaLlmRequest(
+                    request_id=f"{run_id}_{topic_id}",
+                    messages=[
+                        {"role": "system", "content": SYS_QRELS_GRADE},
+                        {"role": "user", "content": _QRELS_USER(numbered, text)},
+                    ],
+                    temperature=0.0,
+                )
+            ))
 
         if requests_info:
-            print(f"MinnaQrelsCreator: Sending {len(requests_info)} LLM grading requests "
-                  f"({len(cache)} already cached)...")
+            print(f"MinnaQrelsCreator: Sending {len(requests_info)} fused grading requests "
+                  f"(1 per response, {len(cache)} grades already cached)...")
             # Process in chunks so progress is saved if crashes.
             BATCH_SIZE = 5000
             for batch_start in range(0, len(requests_info), BATCH_SIZE):
                 batch = requests_info[batch_start:batch_start + BATCH_SIZE]
                 try:
-                    results = asyncio.run(backend.run_batched([req for _, _, _, req in batch]))
-                    for (run_id, topic_id, nug_id, _), result in zip(batch, results):
-                        cache_key = f"{run_id}_{topic_id}_{nug_id}"
-                        cache[cache_key] = self._parse_graded(result)
+                    results = run_async(backend.run_batched([req for _, _, _, req in batch]))
+                    for (run_id, topic_id, nugget_ids, _), result in zip(batch, results):
+                        grades = parse_grade_array(result, len(nugget_ids), 5)
+                        for nug_id, grade in zip(nugget_ids, grades):
+                            cache[f"{run_id}_{topic_id}_{nug_id}"] = grade
                 except Exception as e:
                     print(f"WARNING: Batch {batch_start}-{batch_start + len(batch)} failed: {e}")
                     print(f"  Saving {len(cache)} cached grades before re-raising...")
@@ -290,44 +473,96 @@ class MinnaQrelsCreator:
 
     
         max_grade = grade_range[1]
-        for response in responses:
-            topic_id = response.metadata.topic_id
-            run_id = response.metadata.run_id
-            text = response.get_report_text()
-            if topic_id not in nugget_banks.banks:
-                continue
-            nuggets = nugget_banks.banks[topic_id].nuggets_as_list()
-            if not nuggets:
-                continue
-            tallies = [
-                cache.get(f"{run_id}_{topic_id}_{n.question_id}", 0)
-                for n in nuggets
-            ]
+        # fix2-8: gather tallies into one preallocated int8 matrix (-1 marks
+        # unused nugget columns) and grade all responses in a single
+        # vectorized reduction instead of per-response Python sums
+        scored = [
+            (response, topic_nuggets[response.metadata.topic_id])
+            for response in responses
+            if response.metadata.topic_id in nugget_banks.banks
+        ]
+        scored = [(r, n) for r, n in scored if n]
+        if scored:
+            tallies = np.full((len(scored), max(len(n) for _, n in scored)), -1, dtype=np.int8)
+            for row, (response, nuggets) in enumerate(scored):
+                run_id = response.metadata.run_id
+                topic_id = response.metadata.topic_id
+                for col, nugget in enumerate(nuggets):
+                    tallies[row, col] = cache.get(f"{run_id}_{topic_id}_{nugget.question_id}", 0)
+            valid = tallies >= 0
             # each nugget scored 0-5; normalize to [0,1]
-            avg = sum(tallies) / (len(tallies) * 5.0)
-            grade = round(max_grade * avg)
-            grade_records.append(GradeRecord(topic_id, text, grade))
+            avgs = (tallies * valid).sum(axis=1) / (valid.sum(axis=1) * 5.0)
+            grades = np.rint(max_grade * avgs).astype(int)
+            for (response, _), grade in zip(scored, grades):
+                grade_records.append(GradeRecord(
+                    response.metadata.topic_id,
+                    texts[(response.metadata.run_id, response.metadata.topic_id)],
+                    int(grade),
+                ))
 
         qrels = build_qrels(records=grade_records, spec=MINIMAL_QRELS_SPEC)
         print(f"MinnaQrelsCreator: Created qrels for {len(grade_records)} responses")
         return qrels
 
-    def _parse_graded(self, result) -> int:
-        """Parse 0-5 graded response from LLM."""
-        try:
-            text = result.text.strip()
-            for char in text:
-                if char in ("0", "1", "2", "3", "4", "5"):
-                    return int(char)
-            return 0
-        except:
-            return 0
-
 
 # =============================================================================
-# Cache helpers
+# Cache / event-loop helpers
 # =============================================================================
 
+# One loop for the whole process: asyncio.run would tear down the loop (and
+# any keep-alive HTTP connections the backend parks on it) after every batch,
+# paying TCP/TLS warm-up again in each phase.
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_async(coro):
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+    return _event_loop.run_until_complete(coro)
+
+
+def parse_grade_array(result, expected: int, max_grade: int) -> List[int]:
+    """Parse a JSON array of integer grades; clamp to [0, max_grade] and
+    pad/truncate to the expected number of questions."""
+    try:
+        parsed = json_loads(result.text)
+        if not isinstance(parsed, list):
+            print(f"WARNING: LLM returned non-list grades: {type(parsed)}")
+            parsed = []
+    except (json.JSONDecodeError, AttributeError, TypeError) as e:
+        # TypeError covers result.text=None — one degenerate reply must
+        # score 0, not abort the whole phase via the batch loop's except
+        print(f"WARNING: Failed to parse LLM grades: {e}")
+        parsed = []
+
+    grades: List[int] = []
+    for item in parsed[:expected]:
+        try:
+            grades.append(min(max(int(item), 0), max_grade))
+        except (TypeError, ValueError):
+            grades.append(0)
+    grades += [0] * (expected - len(grades))
+    return grades
+
+
+# Backends are memoized per llm_config so the workflow phases reuse one HTTP
+# client (and its warm keep-alive connections) instead of rebuilding config,
+# client and auth state once per phase.
+_backend_cache: Dict[str, OpenAIMinimaLlm] = {}
+
+
+def get_backend(llm_config: LlmConfigProtocol) -> OpenAIMinimaLlm:
+    key = json.dumps(llm_config.raw, sort_keys=True) if llm_config.raw else ""
+    backend = _backend_cache.get(key)
+    if backend is None:
+        full_config = MinimaLlmConfig.from_dict(llm_config.raw) if llm_config.raw else MinimaLlmConfig.from_env()
+        full_config = dataclasses.replace(full_config, rpm=300, max_attempts=100, max_outstanding=8)
+        backend = OpenAIMinimaLlm(full_config)
+        _backend_cache[key] = backend
+    return backend
+
+
 def load_cache(path):
     if os.path.exists(path):
         with open(path) as f:
@@ -362,237 +597,16 @@ class MinnaLeaderboardJudge:
         cache_tag = "mission3"
         os.makedirs(cache_dir, exist_ok=True)
         expected_topic_ids: List[str] = [t.request_id for t in rag_topics]
-        full_config = MinimaLlmConfig.from_dict(llm_config.raw) if llm_config.raw else MinimaLlmConfig.from_env()
-        full_config = dataclasses.replace(full_config, rpm=300, max_attempts=100, max_outstanding=8)
-        backend = OpenAIMinimaLlm(full_config)
+        backend = get_backend(llm_config)
         responses = list(rag_responses)
 
-        retrieval_cache_path = f"{cache_dir}/retrieval_quality_cache_{cache_tag}.json"
-        retrieval_cache = load_cache(retrieval_cache_path)
-        # Each request checks (system, topic, nugget) 
-        retrieval_requests: List[Tuple[str, str, str, MinimaLlmRequest]] = []
-
-        retrieval_quality: Dict[Tuple[str, str], float] = {}
-
-        if nugget_banks:
-            for response in responses:
-                topic_id = response.metadata.topic_id
-                run_id = response.metadata.run_id
-                if topic_id not in nugget_banks.banks:
-                    continue
-                if not response.documents:
-                    continue
-
-                nuggets = nugget_banks.banks[topic_id].nuggets_as_list()
-
-                # Build a single "retrieval context",
-                # truncate each doc to 1000 chars & cap at 20 docs 
-                doc_texts = []
-                for doc_id, doc in response.documents.items():
-                    doc_texts.append(doc.text[:1000])
-                combined_docs = "\n---\n".join(doc_texts[:20])
-
-                for nugget in nuggets:
-                    cache_key = f"{run_id}_{topic_id}_{nugget.question_id}"
-                    if cache_key in retrieval_cache:
-                        continue
-
-               
-                    retrieval_requests.append((
-                        run_id, topic_id, nugget.question_id,
-                        MinimaLlmRequest(
-                            request_id=cache_key,
-                            messages=[
-                                {"role": "system", "content": (
-                                    "Do these retrieved documents contain information "
-                                    "that answers this question? Reply with a single number:\n"
-                                    "  2 = documents fully answer the question\n"
-                                    "  1 = documents partially answer the question\n"
-                                    "  0 = documents do not answer the question"
-                                )},
-                                {"role": "user", "content": (
-                                    f"Question: {nugget.question}\n\n"
-                                    f"Retrieved documents:\n{combined_docs}"
-                                )},
-                            ],
-                            temperature=0.0,
-                        )
-                    ))
-
-            if retrieval_requests:
-                print(f"RetrievalQuality: Sending {len(retrieval_requests)} LLM requests...")
-                BATCH_SIZE = 5000
-                for batch_start in range(0, len(retrieval_requests), BATCH_SIZE):
-                    batch = retrieval_requests[batch_start:batch_start + BATCH_SIZE]
-                    try:
-                        ret_results = asyncio.run(backend.run_batched(
-                            [req for _, _, _, req in batch]
-                        ))
-                        for (run_id, topic_id, nug_id, _), result in zip(batch, ret_results):
-                            cache_key = f"{run_id}_{topic_id}_{nug_id}"
-                            try:
-                                text = result.text.strip()
-                                score = 0
-                                for char in text:
-                                    if char in ("0", "1", "2"):
-                                        score = int(char)
-                                        break
-                            except:
-                                score = 0
-                            retrieval_cache[cache_key] = score
-                    except Exception as e:
-                        print(f"WARNING: Retrieval batch {batch_start}-{batch_start + len(batch)} failed: {e}")
-                        print(f"  Saving {len(retrieval_cache)} cached scores before re-raising...")
-                        save_cache(retrieval_cache, retrieval_cache_path)
-                        raise
-                    save_cache(retrieval_cache, retrieval_cache_path)
-                    print(f"  RetrievalQuality progress: {min(batch_start + BATCH_SIZE, len(retrieval_requests))}/{len(retrieval_requests)} "
-                          f"submitted, {len(retrieval_cache)} total cached")
-
-            # and normalize to 0-1 (max per nugget is 2)
-            for response in responses:
-                topic_id = response.metadata.topic_id
-                run_id = response.metadata.run_id
-                if topic_id not in nugget_banks.banks:
-                    continue
-                nuggets = nugget_banks.banks[topic_id].nuggets_as_list()
-                if not nuggets:
-                    continue
-                scores_list = []
-                for nugget in nuggets:
-                    cache_key = f"{run_id}_{topic_id}_{nugget.question_id}"
-                    scores_list.append(retrieval_cache.get(cache_key, 0))
-                retrieval_quality[(run_id, topic_id)] = sum(scores_list) / (len(scores_list) * 2.0)
-
-        print(f"RetrievalQuality: Scored {len(retrieval_quality)} (run, topic) pairs")
-
-    
-        qrels_grades_cache_path = MinnaQrelsCreator.CACHE_PATH
-        qrels_grades_cache = load_cache(qrels_grades_cache_path)
-        response_nugget_score: Dict[Tuple[str, str], float] = {}
-
-        if nugget_banks:
-            for response in responses:
-                topic_id = response.metadata.topic_id
-                run_id = response.metadata.run_id
-                if topic_id not in nugget_banks.banks:
-                    continue
-                nuggets = nugget_banks.banks[topic_id].nuggets_as_list()
-                if not nuggets:
-                    continue
-                tallies = [
-                    qrels_grades_cache.get(f"{run_id}_{topic_id}_{n.question_id}", 0)
-                    for n in nuggets
-                ]
-                # 0-5 per nugget → normalize to [0, 1]
-                response_nugget_score[(run_id, topic_id)] = sum(tallies) / (len(tallies) * 5.0)
-
-        print(f"ResponseNugget: Scored {len(response_nugget_score)} (run, topic) pairs "
-              f"from {len(qrels_grades_cache)} cached grades")
-
-        # ──────────────── Claims extraction ────────────────
-        claims_cache_path = f"{cache_dir}/claims_cache_{cache_tag}.json"
-        claims_cache = load_cache(claims_cache_path)
-        requests_info: List[Tuple[str, str, MinimaLlmRequest]] = []
-
-        for response in responses:
-            topic_id = response.metadata.topic_id
-            key = f"{response.metadata.run_id}_{topic_id}"
-            if key in claims_cache:
-                continue
-            text = response.get_report_text()
-            requests_info.append((
-                response.metadata.run_id, topic_id,
-                MinimaLlmRequest(
-                    request_id=f"{response.metadata.run_id}_{topic_id}",
-                    messages=[
-                        {"role": "system", "content": (
-                            "You are a claim extractor. Break this response into specific claims that "
-                            "could be verified against a source document. Each claim should be a single, "
-                            "self-contained statement. Include all types: facts, opinions, predictions, "
-                            "and hedged statements. For hedged claims, preserve the hedging language. "
-                            "Return ONLY a JSON array of strings. "
-                            "Example: [\"The war started in 1914.\", "
-                            "\"Everybody in the family agreed that it was a bad meal.\"] "
-                        )},
-                        {"role": "user", "content": f"Response: {text}"},
-                    ],
-                    temperature=0.3,
-                )
-            ))
-
-        claims: Dict[Tuple[str, str], List[str]] = {}
-        for key, value in claims_cache.items():
-            r_id, t_id = key.split("_", 1)
-            claims[(r_id, t_id)] = value
-
-        if requests_info:
-            print(f"Claims extraction: Sending {len(requests_info)} LLM requests "
-                  f"({len(claims_cache)} already cached)...")
-            try:
-                results = asyncio.run(backend.run_batched([req for _, _, req in requests_info]))
-                for (run_id, topic_id, _), result in zip(requests_info, results):
-                    key = f"{run_id}_{topic_id}"
-                    try:
-                        parsed = json.loads(result.text)
-                    except (json.JSONDecodeError, AttributeError):
-                        parsed = []
-                    parsed = [c for c in parsed if isinstance(c, str) and len(c.strip()) >= 10]
-                    claims[(run_id, topic_id)] = parsed
-                    claims_cache[key] = parsed
-            except Exception as e:
-                print(f"WARNING: Claims batch failed: {e}")
-                print(f"  Saving {len(claims_cache)} cached claims before re-raising...")
-                save_cache(claims_cache, claims_cache_path)
-                raise
-            save_cache(claims_cache, claims_cache_path)
-
-        # ── Stage 2a: Attribution score (claim × all docs, continuous max-pool) ──
-        # get max (claim, doc)
-        nli_scores_cache_path = f"{cache_dir}/nli_scores_continuous_{cache_tag}.json"
-        nli_scores_cache = load_cache(nli_scores_cache_path)
-        score_dict: Dict[Tuple[Tuple[str, str], str], float] = {}
-
-        pairs: List[Tuple[str, str]] = []
-        pair_index: List[Tuple[Tuple[str, str], str, str]] = []
-
-        for response in responses:
-            if not response.documents:
-                continue
-            key = (response.metadata.run_id, response.metadata.topic_id)
-            for claim in claims.get(key, []):
-                cached_max = 0.0
-                # must check ALL docs to find max.
-                for doc_id, doc in response.documents.items():
-                    key_str = f"{key[0]}_{key[1]}_{doc_id}_{claim}"
-                    if key_str in nli_scores_cache:
-                        cached_max = max(cached_max, float(nli_scores_cache[key_str]))
-                    else:
-                        pairs.append((doc.text, claim))
-                        pair_index.append((key, doc_id, claim))
-                score_dict[(key, claim)] = cached_max
-
-        CHUNK_SIZE = 500
-        if pairs:
-            print(f"Attribution NLI: {len(pairs)} pairs to score on {nli_model._device}", flush=True)
-            for i in range(0, len(pairs), CHUNK_SIZE):
-                chunk_scores = nli_model.predict(pairs[i:i + CHUNK_SIZE])
-                print(f"  Attribution NLI: {min(i + CHUNK_SIZE, len(pairs))}/{len(pairs)} done", flush=True)
-                for j, score in enumerate(chunk_scores):
-                    idx = i + j
-                    key, doc_id, claim = pair_index[idx]
-                    key_str = f"{key[0]}_{key[1]}_{doc_id}_{claim}"
-                    float_score = float(score)
-                    nli_scores_cache[key_str] = float_score
-                    if float_score > score_dict.get((key, claim), 0.0):
-                        score_dict[(key, claim)] = float_score
-                # save cache every 10 chunks to avoid losing progress
-                if (i // CHUNK_SIZE) % 10 == 9:
-                    save_cache(nli_scores_cache, nli_scores_cache_path)
-
-        save_cache(nli_scores_cache, nli_scores_cache_path)
-
-        # ── Stage 2b: Citation accuracy ────
+        # ── Stage 2b prep: Citation accuracy ────
+        # The (cited doc, fragment) pairs depend only on the responses, so
+        # collect them now and score them on a worker thread while the
+        # LLM-bound stages below wait on the network. torch releases the GIL
+        # inside the forward pass, so the NLI compute genuinely overlaps the
+        # HTTP round-trips; a process pool would duplicate model weights and
+        # CUDA context for no extra win.
         citation_cache_path = f"{cache_dir}/citation_deberta_cache_{cache_tag}.json"
         citation_cache = load_cache(citation_cache_path)
 
@@ -638,37 +652,308 @@ class MinnaLeaderboardJudge:
 
             citation_info[key] = (supported, total_cited)
 
-        # Run deberta NLI 
-        if cite_pairs:
+        # set when an LLM stage fails so the worker bails at the next chunk
+        # boundary instead of grinding through scores nobody will read
+        citation_stop = threading.Event()
+
+        def _score_citations():
+            if not cite_pairs:
+                return
+            citation_nli_model = _get_citation_nli()
             print(f"Citation NLI (deberta): {len(cite_pairs)} pairs", flush=True)
-            for i in range(0, len(cite_pairs), CHUNK_SIZE):
-                chunk_scores = citation_nli_model.predict(cite_pairs[i:i + CHUNK_SIZE])
-                print(f"  Citation NLI (deberta): {min(i + CHUNK_SIZE, len(cite_pairs))}/{len(cite_pairs)} done", flush=True)
-                for j, score in enumerate(chunk_scores):
+            CITE_CHUNK = 500
+            for i in range(0, len(cite_pairs), CITE_CHUNK):
+                if citation_stop.is_set():
+                    print("Citation NLI (deberta): stop requested, keeping chunks scored so far", flush=True)
+                    break
+                chunk_scores = citation_nli_model.predict(
+                    cite_pairs[i:i + CITE_CHUNK], batch_size=64, show_progress_bar=False
+                )
+                print(f"  Citation NLI (deberta): {min(i + CITE_CHUNK, len(cite_pairs))}/{len(cite_pairs)} done", flush=True)
+                # entailment (column 1) must be largest — one argmax over the
+                # whole chunk instead of per-row Python branching
+                supported_flags = (np.asarray(chunk_scores).argmax(axis=1) == 1)
+                for j, is_supported in enumerate(supported_flags):
                     idx = i + j
                     key, frag_idx = cite_pair_index[idx]
                     cache_key = f"{key[0]}_{key[1]}_{frag_idx}"
-                    # entailment must be largest
-                    is_supported = 1 if (score[1] > score[0] and score[1] > score[2]) else 0
+                    is_supported = int(is_supported)
                     citation_cache[cache_key] = is_supported
                     if is_supported:
                         prev_sup, prev_total = citation_info[key]
                         citation_info[key] = (prev_sup + 1, prev_total)
+                # save cache every 10 chunks to avoid losing progress
+                if (i // CITE_CHUNK) % 10 == 9:
+                    save_cache(citation_cache, citation_cache_path)
 
-        save_cache(citation_cache, citation_cache_path)
+        nli_executor = ThreadPoolExecutor(max_workers=1)
+        citation_future = nli_executor.submit(_score_citations)
+
+        # Everything from here to the citation join can raise (each LLM
+        # batch loop re-raises after saving its own cache); the wrapper
+        # below makes sure the citation worker is stopped, joined and its
+        # cache persisted on that path too, not just on success.
+        stage_failed = False
+        try:
+            retrieval_cache_path = f"{cache_dir}/retrieval_quality_cache_{cache_tag}.json"
+            retrieval_cache = load_cache(retrieval_cache_path)
+            # fix2-7: one fused request checks (system, topic, ALL nuggets)
+            retrieval_requests: List[Tuple[str, str, List[str], MinimaLlmRequest]] = []
+
+            retrieval_quality: Dict[Tuple[str, str], float] = {}
+
+            # hoist: nuggets_as_list() builds a fresh list per call — once per
+            # topic is enough, not once per response
+            topic_nuggets = (
+                {tid: bank.nuggets_as_list() for tid, bank in nugget_banks.banks.items()}
+                if nugget_banks else {}
+            )
+
+            if nugget_banks:
+                for response in responses:
+                    topic_id = response.metadata.topic_id
+                    run_id = response.metadata.run_id
+                    if topic_id not in nugget_banks.banks:
+                        continue
+                    if not response.documents:
+                        continue
+
+                    nuggets = topic_nuggets[topic_id]
+
+                    if all(f"{run_id}_{topic_id}_{n.question_id}" in retrieval_cache for n in nuggets):
+                        continue
+
+                    # Build a single "retrieval context",
+                    # truncate each doc to 1000 chars & cap at 20 docs
+                    doc_texts = []
+                    for doc_id, doc in response.documents.items():
+                        doc_texts.append(doc.text[:1000])
+                    combined_docs = "\n---\n".join(doc_texts[:20])
+
+                    numbered = "\n".join(f"{i + 1}. {n.question}" for i, n in enumerate(nuggets))
+                    retrieval_requests.append((
+                        run_id, topic_id, [n.question_id for n in nuggets],
+                        MinimaLlmRequest(
+                            request_id=f"{run_id}_{topic_id}",
+                            messages=[
+                                {"role": "system", "content": SYS_RETRIEVAL},
+                                {"role": "user", "content": _RETRIEVAL_USER(numbered, combined_docs)},
+                            ],
+                            temperature=0.0,
+                        )
+                    ))
+
+                if retrieval_requests:
+                    print(f"RetrievalQuality: Sending {len(retrieval_requests)} fused LLM requests "
+                          f"(1 per response)...")
+                    BATCH_SIZE = 5000
+                    for batch_start in range(0, len(retrieval_requests), BATCH_SIZE):
+                        batch = retrieval_requests[batch_start:batch_start + BATCH_SIZE]
+                        try:
+                            ret_results = run_async(backend.run_batched(
+                                [req for _, _, _, req in batch]
+                            ))
+                            for (run_id, topic_id, nugget_ids, _), result in zip(batch, ret_results):
+                                scores = parse_grade_array(result, len(nugget_ids), 2)
+                                for nug_id, score in zip(nugget_ids, scores):
+                                    retrieval_cache[f"{run_id}_{topic_id}_{nug_id}"] = score
+                        except Exception as e:
+                            print(f"WARNING: Retrieval batch {batch_start}-{batch_start + len(batch)} failed: {e}")
+                            print(f"  Saving {len(retrieval_cache)} cached scores before re-raising...")
+                            save_cache(retrieval_cache, retrieval_cache_path)
+                            raise
+                        save_cache(retrieval_cache, retrieval_cache_path)
+                        print(f"  RetrievalQuality progress: {min(batch_start + BATCH_SIZE, len(retrieval_requests))}/{len(retrieval_requests)} "
+                              f"submitted, {len(retrieval_cache)} total cached")
+
+                # and normalize to 0-1 (max per nugget is 2)
+                for response in responses:
+                    topic_id = response.metadata.topic_id
+                    run_id = response.metadata.run_id
+                    if topic_id not in nugget_banks.banks:
+                        continue
+                    nuggets = topic_nuggets[topic_id]
+                    if not nuggets:
+                        continue
+                    scores_list = []
+                    for nugget in nuggets:
+                        cache_key = f"{run_id}_{topic_id}_{nugget.question_id}"
+                        scores_list.append(retrieval_cache.get(cache_key, 0))
+                    retrieval_quality[(run_id, topic_id)] = sum(scores_list) / (len(scores_list) * 2.0)
+
+            print(f"RetrievalQuality: Scored {len(retrieval_quality)} (run, topic) pairs")
+
+    
+            qrels_grades_cache_path = MinnaQrelsCreator.CACHE_PATH
+            qrels_grades_cache = load_cache(qrels_grades_cache_path)
+            response_nugget_score: Dict[Tuple[str, str], float] = {}
+
+            if nugget_banks:
+                for response in responses:
+                    topic_id = response.metadata.topic_id
+                    run_id = response.metadata.run_id
+                    if topic_id not in nugget_banks.banks:
+                        continue
+                    nuggets = topic_nuggets[topic_id]
+                    if not nuggets:
+                        continue
+                    tallies = [
+                        qrels_grades_cache.get(f"{run_id}_{topic_id}_{n.question_id}", 0)
+                        for n in nuggets
+                    ]
+                    # 0-5 per nugget → normalize to [0, 1]
+                    response_nugget_score[(run_id, topic_id)] = sum(tallies) / (len(tallies) * 5.0)
+
+            print(f"ResponseNugget: Scored {len(response_nugget_score)} (run, topic) pairs "
+                  f"from {len(qrels_grades_cache)} cached grades")
+
+            # ──────────────── Claims extraction ────────────────
+            claims_cache_path = f"{cache_dir}/claims_cache_{cache_tag}.json"
+            claims_cache = load_cache(claims_cache_path)
+            requests_info: List[Tuple[str, str, MinimaLlmRequest]] = []
+
+            for response in responses:
+                topic_id = response.metadata.topic_id
+                key = f"{response.metadata.run_id}_{topic_id}"
+                if key in claims_cache:
+                    continue
+                text = response.get_report_text()
+                requests_info.append((
+                    response.metadata.run_id, topic_id,
+                    MinimaLlmRequest(
+                        request_id=f"{response.metadata.run_id}_{topic_id}",
+                        messages=[
+                            {"role": "system", "content": SYS_CLAIMS},
+                            {"role": "user", "content": _CLAIMS_USER(text)},
+                        ],
+                        temperature=0.3,
+                    )
+                ))
+
+            # Rebuild (run_id, topic_id) keys from the responses themselves —
+            # splitting the flat cache key on "_" mis-parses run ids that contain
+            # underscores, so those systems would silently lose all their claims.
+            claims: Dict[Tuple[str, str], List[str]] = {}
+            for response in responses:
+                key = (response.metadata.run_id, response.metadata.topic_id)
+                cached = claims_cache.get(f"{key[0]}_{key[1]}")
+                if cached is not None:
+                    claims[key] = cached
+
+            if requests_info:
+                print(f"Claims extraction: Sending {len(requests_info)} LLM requests "
+                      f"({len(claims_cache)} already cached)...")
+                # stream in bounded chunks: claim replies are large, so peak
+                # memory stays O(chunk) and results are folded into the cache and
+                # dropped as they arrive
+                CLAIMS_BATCH = 256
+                for batch_start in range(0, len(requests_info), CLAIMS_BATCH):
+                    batch = requests_info[batch_start:batch_start + CLAIMS_BATCH]
+                    try:
+                        results = run_async(backend.run_batched([req for _, _, req in batch]))
+                        for (run_id, topic_id, _), result in zip(batch, results):
+                            key = f"{run_id}_{topic_id}"
+                            parsed = parse_claims(result.text)
+                            parsed = [c for c in parsed if isinstance(c, str) and len(c.strip()) >= 10]
+                            claims[(run_id, topic_id)] = parsed
+                            claims_cache[key] = parsed
+                    except Exception as e:
+                        print(f"WARNING: Claims batch {batch_start}-{batch_start + len(batch)} failed: {e}")
+                        print(f"  Saving {len(claims_cache)} cached claims before re-raising...")
+                        save_cache(claims_cache, claims_cache_path)
+                        raise
+                    save_cache(claims_cache, claims_cache_path)
+
+            # ── Stage 2a: Attribution score (claim × all docs, continuous max-pool) ──
+            # get max (claim, doc)
+            nli_scores_cache_path = f"{cache_dir}/nli_scores_continuous_{cache_tag}.json"
+            nli_scores_cache = load_cache(nli_scores_cache_path)
+            score_dict: Dict[Tuple[Tuple[str, str], str], float] = {}
+
+            # Dedupe: overlapping retrieved docs and near-identical claims repeat
+            # across runs/topics — score each unique (doc, claim) pair once and
+            # fan the result out to every place that needs it.
+            pairs: List[Tuple[str, str]] = []
+            pair_pos: Dict[Tuple[str, str], int] = {}
+            pair_targets: List[List[Tuple[Tuple[str, str], str, str]]] = []
+            total_refs = 0
+
+            for response in responses:
+                if not response.documents:
+                    continue
+                key = (response.metadata.run_id, response.metadata.topic_id)
+                for claim in claims.get(key, []):
+                    cached_max = 0.0
+                    # must check ALL docs to find max.
+                    for doc_id, doc in response.documents.items():
+                        key_str = f"{key[0]}_{key[1]}_{doc_id}_{claim}"
+                        if key_str in nli_scores_cache:
+                            cached_max = max(cached_max, float(nli_scores_cache[key_str]))
+                        else:
+                            pair = (doc.text, claim)
+                            pos = pair_pos.get(pair)
+                            if pos is None:
+                                pos = len(pairs)
+                                pair_pos[pair] = pos
+                                pairs.append(pair)
+                                pair_targets.append([])
+                            pair_targets[pos].append((key, doc_id, claim))
+                            total_refs += 1
+                    score_dict[(key, claim)] = cached_max
+
+            CHUNK_SIZE = 500
+            if pairs:
+                nli_model = _get_nli()
+                print(f"Attribution NLI: {len(pairs)} unique pairs to score "
+                      f"({total_refs - len(pairs)} duplicates skipped) on {nli_model._device}", flush=True)
+                for i in range(0, len(pairs), CHUNK_SIZE):
+                    chunk_scores = nli_model.predict(pairs[i:i + CHUNK_SIZE])
+                    print(f"  Attribution NLI: {min(i + CHUNK_SIZE, len(pairs))}/{len(pairs)} done", flush=True)
+                    for j, score in enumerate(chunk_scores):
+                        idx = i + j
+                        float_score = float(score)
+                        for key, doc_id, claim in pair_targets[idx]:
+                            key_str = f"{key[0]}_{key[1]}_{doc_id}_{claim}"
+                            nli_scores_cache[key_str] = float_score
+                            if float_score > score_dict.get((key, claim), 0.0):
+                                score_dict[(key, claim)] = float_score
+                    # save cache every 10 chunks to avoid losing progress
+                    if (i // CHUNK_SIZE) % 10 == 9:
+                        save_cache(nli_scores_cache, nli_scores_cache_path)
+
+            save_cache(nli_scores_cache, nli_scores_cache_path)
+        except BaseException:
+            stage_failed = True
+            citation_stop.set()
+            raise
+        finally:
+            # ── Stage 2b: Citation accuracy (scored concurrently) ────
+            try:
+                citation_future.result()
+            except Exception as e:
+                if not stage_failed:
+                    raise
+                print(f"WARNING: citation NLI worker also failed: {e}")
+            finally:
+                nli_executor.shutdown()
+                save_cache(citation_cache, citation_cache_path)
 
         
         # ── Build leaderboard───────────────────────────
+        # fold per-claim attribution maxima into per-response averages once;
+        # the builder loop then does O(1) lookups instead of hashing a
+        # ((run, topic), claim) tuple per claim per response
+        attribution_avg: Dict[Tuple[str, str], float] = {
+            key: sum(score_dict.get((key, c), 0.0) for c in claim_list) / len(claim_list)
+            for key, claim_list in claims.items() if claim_list
+        }
+
         builder: LeaderboardBuilder = LeaderboardBuilder(MINIMAL_SPEC)
         for response in responses:
             key = (response.metadata.run_id, response.metadata.topic_id)
             topic_id = response.metadata.topic_id
 
-            claim_list = claims.get(key, [])
-            if claim_list:
-                attribution = sum(score_dict.get((key, c), 0.0) for c in claim_list) / len(claim_list)
-            else:
-                attribution = 0.0
+            attribution = attribution_avg.get(key, 0.0)
 
             cite_sup, cite_total = citation_info.get(key, (0, 0))
             cite_acc = cite_sup / cite_total if cite_total > 0 else 0.0
@@ -12,6 +12,7 @@ import asyncio
 import dataclasses
 import json
 import os
+import re
 from collections import defaultdict
 from typing import Any, Dict, List, Sequence, Tuple
 
@@ -49,18 +50,55 @@ PAIRWISE_SYSTEM_PROMPT = (
     "Reply with ONLY the letter (A, B, C, D, or E)."
 )
 
+# prebound str.format — one C-level call per request in the build loop
+_PAIRWISE_USER = (
+    "Question: {}\n\n"
+    "Response A (reference):\n{}\n\n"
+    "Response B:\n{}"
+).format
+
 #---------------------- UTILITIES ----------------------
 
+# precompiled: avoids allocating stripped/uppercased copies of every reply
+_LETTER_RE = re.compile(r"\s*([A-Ea-e])")
+
+
 def _parse_letter(result) -> str:
     """Extract a category letter from LLM response."""
     try:
-        text = result.text.strip().upper()
-        for letter in CATEGORY_SCORES:
-            if text.startswith(letter):
-                return letter
+        m = _LETTER_RE.match(result.text)
     except (AttributeError, TypeError):
-        pass
-    return "E"
+        return "E"
+    return m.group(1).upper() if m else "E"
+
+
+# One loop for the whole process: asyncio.run would tear down the loop (and
+# any keep-alive HTTP connections the backend parks on it) after every batch.
+_event_loop = None
+
+
+def run_async(coro):
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+    return _event_loop.run_until_complete(coro)
+
+
+# Backends are memoized per llm_config so the workflow phases reuse one HTTP
+# client (and its warm keep-alive connections) instead of rebuilding config,
+# client and auth state once per phase.
+_backend_cache: Dict[str, OpenAIMinimaLlm] = {}
+
+
+def get_backend(llm_config: LlmConfigProtocol) -> OpenAIMinimaLlm:
+    key = json.dumps(llm_config.raw, sort_keys=True) if llm_config.raw else ""
+    backend = _backend_cache.get(key)
+    if backend is None:
+        full_config = MinimaLlmConfig.from_dict(llm_config.raw) if llm_config.raw else MinimaLlmConfig.from_env()
+        full_config = dataclasses.replace(full_config, rpm=300, max_attempts=100, max_outstanding=8)
+        backend = OpenAIMinimaLlm(full_config)
+        _backend_cache[key] = backend
+    return backend
 
 
 def load_cache(path):
@@ -107,16 +145,7 @@ class PairwisePreferenceJudge:
         cache_path = f"{filebase}.pairwise_cache.json"
         cache = load_cache(cache_path)
 
-        full_config = (
-            MinimaLlmConfig.from_dict(llm_config.raw)
-            if llm_config.raw
-            else MinimaLlmConfig.from_env()
-        )
-        full_config = dataclasses.replace(
-            full_config, rpm=300, max_attempts=100, max_outstanding=8
-        )
-
-        backend = OpenAIMinimaLlm(full_config)
+        backend = get_backend(llm_config)
         topic_questions = {t.request_id: t.problem_statement for t in rag_topics}
 
         # ── 1. text_dict: all response texts ──────────────────────────
@@ -185,17 +214,13 @@ class PairwisePreferenceJudge:
                     request_id=f"pw_{tid}_{rid}_{direction}",
                     messages=[
                         {"role": "system", "content": PAIRWISE_SYSTEM_PROMPT},
-                        {"role": "user", "content": (
-                            f"Question: {question}\n\n"
-                            f"Response A (reference):\n{resp_a}\n\n"
-                            f"Response B:\n{resp_b}"
-                        )},
+                        {"role": "user", "content": _PAIRWISE_USER(question, resp_a, resp_b)},
                     ],
                     temperature=0.0,
                 ))
 
             print(f"PairwiseJudge: Sending {len(llm_requests)} LLM requests (fix2-5: includes swapped pairs)...")
-            results = asyncio.run(backend.run_batched(llm_requests))
+            results = run_async(backend.run_batched(llm_requests))
 
             # ── 6. zip results back into cache ────────────────────────
             for (rid, tid, direction), result in zip(requests_info, results):